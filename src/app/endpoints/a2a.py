@@ -828,7 +828,7 @@ async def handle_a2a_jsonrpc(  # pylint: disable=too-many-locals,too-many-statem
                         )
                         break
                     chunk_count += 1
-                    logger.debug("Chunk sent to A2A client: %s", str(chunk))
+                    logger.debug("Chunk sent to A2A client: %s", chunk)
                     yield chunk
             finally:
                 # Ensure the app task is cleaned up
@@ -116,7 +116,7 @@ async def feedback_endpoint_handler(
         HTTPException: Returns HTTP 403 if conversation belongs to a different user.
         HTTPException: Returns HTTP 500 if feedback storage fails.
     """
-    logger.debug("Feedback received %s", str(feedback_request))
+    logger.debug("Feedback received %s", feedback_request)
 
     user_id, _, _, _ = auth
     check_configuration_loaded(configuration)
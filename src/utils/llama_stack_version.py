@@ -14,6 +14,10 @@ from log import get_logger
 
 logger = get_logger(__name__)
 
+# Extracts the MAJOR.MINOR.PATCH core from a reported version string. re.ASCII
+# limits \d to [0-9], the only digits semver accepts.
+_VERSION_PATTERN = re.compile(r"\d+\.\d+\.\d+", re.ASCII)
+
 
 class InvalidLlamaStackVersionException(Exception):
     """Llama Stack version is not valid."""
@@ -61,8 +65,7 @@ def compare_versions(version_info: str, minimal: str, maximal: str) -> None:
         InvalidLlamaStackVersionException: If `version_info` is outside the
         inclusive range defined by `minimal` and `maximal`.
     """
-    version_pattern = r"\d+\.\d+\.\d+"
-    match = re.search(version_pattern, version_info)
+    match = _VERSION_PATTERN.search(version_info)
     if not match:
         logger.warning(
             "Failed to extract version pattern from '%s'. Skipping version check.",
@@ -461,9 +461,7 @@ async def _fetch_solr_rag(
             )
 
             if query_response.chunks:
-                retrieved_scores = (
-                    query_response.scores if hasattr(query_response, "scores") else []
-                )
+                retrieved_scores = getattr(query_response, "scores", [])
 
                 # Limit to top N chunks
                 top_chunks = query_response.chunks[: constants.OKP_RAG_MAX_CHUNKS]
@@ -604,13 +602,13 @@ def _convert_solr_chunks_to_rag_format(
                     attributes["doc_url"] = reference_url
 
         # For Solr chunks, also extract from chunk_metadata
-        if hasattr(chunk, "chunk_metadata") and chunk.chunk_metadata:
-            if hasattr(chunk.chunk_metadata, "document_id"):
-                doc_id = chunk.chunk_metadata.document_id
-                attributes["document_id"] = doc_id
-                # Build URL if not already set
-                if "doc_url" not in attributes and offline and doc_id:
-                    attributes["doc_url"] = urljoin(constants.MIMIR_DOC_URL, doc_id)
+        chunk_metadata = getattr(chunk, "chunk_metadata", None)
+        if chunk_metadata and hasattr(chunk_metadata, "document_id"):
+            doc_id = chunk_metadata.document_id
+            attributes["document_id"] = doc_id
+            # Build URL if not already set
+            if "doc_url" not in attributes and offline and doc_id:
+                attributes["doc_url"] = urljoin(constants.MIMIR_DOC_URL, doc_id)
 
         # Get score from retrieved_scores list if available
         score = retrieved_scores[i] if i < len(retrieved_scores) else None
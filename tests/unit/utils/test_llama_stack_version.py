@@ -122,3 +122,23 @@ async def test_check_llama_stack_version_too_big_version(
     with subtests.test(msg="Increased all numbers"):
         bigger_version = max_version.bump_major().bump_minor().bump_patch()
         await _check_version_must_fail(mock_client, bigger_version)
+
+
+@pytest.mark.asyncio
+async def test_check_llama_stack_version_non_ascii_digits(
+    mocker: MockerFixture,
+) -> None:
+    """Test that non-ASCII digits are not accepted as a version number."""
+
+    # mock the Llama Stack client
+    mock_client = mocker.AsyncMock()
+
+    # Arabic-Indic digits match Unicode \d but are not valid semver
+    mock_client.inspect.version.return_value = VersionInfo(version="٠.٣.٥")
+
+    # test if the version is rejected before semver parsing
+    with pytest.raises(
+        InvalidLlamaStackVersionException,
+        match="Failed to extract version pattern",
+    ):
+        await check_llama_stack_version(mock_client)